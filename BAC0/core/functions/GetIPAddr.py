@@ -19,6 +19,7 @@ import subprocess
 import re
 
 import struct
+from functools import lru_cache
 
 # from bacpypes.pdu import Address as legacy_Address
 from bacpypes3.pdu import Address
@@ -211,6 +212,16 @@ class HostIP:
             return None
 
 
+@lru_cache(maxsize=4)
+def cached_host_ip(port: t.Optional[int] = None) -> HostIP:
+    """
+    HostIP for a port, resolved once per process. Finding the interface opens
+    a socket and queries the OS, which doesn't need to be repeated each time
+    a network is created.
+    """
+    return HostIP(port)
+
+
 def validate_ip_address(ip: Address) -> bool:
     result = True
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -1,16 +1,21 @@
+import importlib
 import importlib.util
+import sys
+from functools import lru_cache
 from types import ModuleType
 from typing import Type
 
 
 # Function to dynamically import a module
 def import_module(module_name, package=None):
+    # Modules already imported are reused from sys.modules instead of being
+    # executed again (pandas alone costs hundreds of ms per execution)
+    if package is None and module_name in sys.modules:
+        return sys.modules[module_name]
     spec = importlib.util.find_spec(module_name, package)
     if spec is None:
         return None
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return importlib.import_module(module_name, package)
 
 
 def check_dependencies(module_name: list) -> bool:
@@ -55,6 +60,7 @@ def influxdb_if_available():
     return (_INFLUXDB, influxdb_client)
 
 
+@lru_cache(maxsize=None)
 def pandas_if_available() -> tuple[bool, Type, ModuleType, ModuleType]:
     global _PANDAS
     if not check_dependencies(["pandas"]):
@@ -6,7 +6,6 @@ logging feature at the same time.
 Goal is to be able to access quickly to important informations for
 the web interface.
 """
-import inspect
 import logging
 import os
 import sys
@@ -32,6 +31,25 @@ class LogList:
     LOGGERS: t.List[Logger] = []
 
 
+def log_enabled_for(logger: Logger, level: int) -> bool:
+    """
+    BAC0 loggers are kept at DEBUG and filtering is done by the handlers, so
+    logger.isEnabledFor() is always True. This tells if a record of this level
+    would actually reach a handler, so costly messages can be skipped.
+    """
+    if logger.disabled or not logger.isEnabledFor(level):
+        return False
+    _logger: t.Optional[Logger] = logger
+    while _logger is not None:
+        for handler in _logger.handlers:
+            if level >= handler.level:
+                return True
+        if not _logger.propagate:
+            break
+        _logger = _logger.parent
+    return False
+
+
 def convert_level(level):
     if not level:
         return None
@@ -257,12 +275,14 @@ def note_and_log(cls):
             raise ValueError("Provide something to log")
         if isinstance(level, str):
             level = convert_level(level)
+        if not log_enabled_for(cls._log, level):
+            return
         if level == logging.INFO:
             note = f"{note}"
         else:
-            caller_frame = inspect.stack()[1]
-            module = inspect.getmodule(caller_frame[0])
-            module_name = module.__name__ if module else "unknown"
+            # sys._getframe is enough to know the caller module, inspect.stack()
+            # would read the source of every frame in the stack
+            module_name = sys._getframe(1).f_globals.get("__name__", "unknown")
             note = f"{cls.logname} | {module_name} | {note}"
         cls._log.log(level, note)
 
@@ -75,6 +75,7 @@ class Base:
     """
 
     _used_ips: t.Set[Address] = set()
+    _used_boids: t.Set[int] = set()
 
     def __init__(
         self,
@@ -134,9 +135,14 @@ class Base:
             )
         self.networkNumber = networkNumber
 
-        self.Boid = (
-            int(deviceId) if deviceId else (3056177 + int(random.uniform(0, 1000)))
-        )
+        if deviceId:
+            self.Boid = int(deviceId)
+        else:
+            # Avoid giving the same random instance to two BAC0 in this process
+            self.Boid = random.randrange(3056177, 3057177)
+            while self.Boid in Base._used_boids:
+                self.Boid = random.randrange(3056177, 3057177)
+        Base._used_boids.add(self.Boid)
 
         self.segmentationSupported = segmentationSupported
         self.maxSegmentsAccepted = maxSegmentsAccepted
@@ -173,7 +179,7 @@ class Base:
     def startApp(self):
         """
         Define the local device, including services supported.
-        Once defined, start the BACnet stack in its own thread.
+        Once defined, the BACnet stack runs on the current asyncio event loop.
         """
         self.log("Create Local Device", level="debug")
         try:
@@ -282,10 +288,10 @@ class Base:
         # Freeing socket
         self.this_application.app.close()
 
-        self._stopped = True  # Stop stack thread
-        # self.t.join()
+        self._stopped = True
         self._started = False
         Base._used_ips.discard(self.localIPAddr)
+        Base._used_boids.discard(self.Boid)
         self.log("BACnet stopped", level="info")
 
     @property
@@ -11,6 +11,9 @@ and allow communication with other devices.
 
 """
 import asyncio
+import json
+import os
+import re
 import typing as t
 
 # --- standard Python modules ---
@@ -24,7 +27,11 @@ from bacpypes3.primitivedata import ObjectIdentifier
 from BAC0.core.app.asyncApp import BAC0Application
 from BAC0.scripts.Base import Base
 
-from ..core.devices.Device import RPDeviceConnected, RPMDeviceConnected
+from ..core.devices.Device import (
+    DeviceConnected,
+    RPDeviceConnected,
+    RPMDeviceConnected,
+)
 from ..core.devices.Points import Point
 from ..core.devices.Trends import TrendLog
 from ..core.devices.Virtuals import VirtualPoint
@@ -36,7 +43,7 @@ from ..core.functions.Alias import Alias
 # )
 from ..core.functions.Discover import Discover
 from ..core.functions.EventEnrollment import EventEnrollment
-from ..core.functions.GetIPAddr import HostIP
+from ..core.functions.GetIPAddr import cached_host_ip
 from ..core.functions.Reinitialize import Reinitialize
 
 # from ..core.functions.legacy.Reinitialize import Reinitialize
@@ -45,6 +52,7 @@ from ..core.functions.Text import TextMixin
 from ..core.functions.TimeSync import TimeSync
 from ..core.io.IOExceptions import (
     NoResponseFromController,
+    InitializationError,
     NumerousPingFailures,
     Timeout,
     UnrecognizedService,
@@ -76,6 +84,31 @@ if RICH:
 
 # ------------------------------------------------------------------------------
 
+PING_MAX_IDLE_DELAY = 3600
+
+# ip, ip/mask, ip:port or ip/mask:port
+_IP_RE = re.compile(r"(?P<ip>[^/:\s]+)(?:/(?P<mask>\d+))?(?::(?P<port>\d+))?")
+
+
+def parse_ip(
+    ip: str, mask: t.Optional[int] = None, port: t.Optional[int] = None
+) -> t.Tuple[str, int, int]:
+    """
+    Split an ip given as 'ip', 'ip/mask', 'ip:port' or 'ip/mask:port'.
+    Mask and port written in the string win over the mask and port arguments,
+    which default to 24 and 47808.
+
+    :returns: (ip, mask, port)
+    """
+    _match = _IP_RE.fullmatch(ip.strip())
+    if not _match:
+        raise InitializationError(
+            f"IP Address provided ({ip}) invalid. Use 'ip', 'ip/mask' or 'ip/mask:port'"
+        )
+    mask = int(_match["mask"]) if _match["mask"] else (mask or 24)
+    port = int(_match["port"]) if _match["port"] else (port or 47808)
+    return (_match["ip"], mask, port)
+
 
 @note_and_log
 class Lite(
@@ -102,6 +135,12 @@ class Lite(
 
     :param ip='127.0.0.1': Address must be in the same subnet as the BACnet network
         [BBMD and Foreign Device - not supported]
+    :param devices_cache=None: keep names and vendors of discovered devices
+        between sessions. True uses ~/.BAC0/devices.json, a string gives the
+        JSON file to use. None or False keeps them for this session only.
+    :param spin=0.01: interval (sec) used while waiting for the stack to be ready
+        or stopped. Lower gives faster startup/shutdown, higher less idle wakeups.
+    :param low_latency=False: shortcut for spin=0.001
 
     """
 
@@ -116,6 +155,9 @@ class Lite(
         ping: bool = True,
         ping_delay: int = 300,
         db_params: t.Optional[t.Dict[str, t.Any]] = None,
+        devices_cache: t.Union[bool, str, None] = None,
+        spin: float = 0.01,
+        low_latency: bool = False,
         **params,
     ) -> None:
         self._initialized = False
@@ -130,36 +172,35 @@ class Lite(
         )
 
         self.log("Configurating app", level="debug")
-        self._registered_devices = weakref.WeakValueDictionary()
+        self.spin = 0.001 if low_latency else max(0.0, spin)
+        self._registered_devices = weakref.WeakSet()
+
+        # Names and vendors of discovered devices, saved to disk only if asked
+        if devices_cache is True:
+            self._device_cache_path = os.path.join(
+                os.path.expanduser("~"), ".BAC0", "devices.json"
+            )
+        else:
+            self._device_cache_path = devices_cache or None
+        self._device_cache = self._load_device_cache()
+        # Devices (same keys as the devices cache) that don't support readMultiple
+        self._no_rpm: t.Set[str] = set()
 
         # Ping task will deal with all registered device and disconnect them if they do not respond.
 
         self._ping_task = RecurringTask(
             self.ping_registered_devices, delay=ping_delay, name="Ping Task"
         )
+        self._ping_delay = self._ping_task.delay
         if ping:
             self._ping_task.start()
 
         if ip is None:
-            host = HostIP(port)
+            host = cached_host_ip(port)
             mask = host.mask
             ip_addr = host.address
         else:
-            try:
-                ip, subnet_mask_and_port = ip.split("/")
-                try:
-                    mask_s, port_s = subnet_mask_and_port.split(":")
-                    mask = int(mask_s)
-                    port = int(port_s)
-                except ValueError:
-                    mask = int(subnet_mask_and_port)
-            except ValueError:
-                ip = ip
-
-            if not mask:
-                mask = 24
-            if not port:
-                port = 47808
+            ip, mask, port = parse_ip(ip, mask, port)
             ip_addr = Address(f"{ip}/{mask}:{port}")
         self._log.info(
             f"Using ip : {ip_addr}/{mask} on port {ip_addr.addrPort} | broadcast : {ip_addr.addrBroadcastTuple[0]}"
@@ -175,6 +216,7 @@ class Lite(
         )
         self.log(f"Device instance (id) : {self.Boid}", level="info")
         self.bokehserver = False
+        # Points compare by value (and are not hashable), so they are keyed by id
         self._points_to_trend = weakref.WeakValueDictionary()
 
         # Do what's needed to support COV
@@ -218,7 +260,7 @@ class Lite(
         while self.this_application.app is None or not asyncio.iscoroutinefunction(
             self.this_application.app.i_am
         ):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(self.spin)
         _this_application: BAC0Application = self.this_application
         _app: Application = _this_application.app
 
@@ -251,8 +293,12 @@ class Lite(
     def register_device(
         self, device: t.Union[RPDeviceConnected, RPMDeviceConnected]
     ) -> None:
-        oid = id(device)
-        self._registered_devices[oid] = device
+        self._registered_devices.add(device)
+        if self._ping_task.delay != self._ping_delay:
+            # Ping task was idling, bring it back to its normal pace so the
+            # first ping happens one ping_delay after registration
+            self._ping_task.delay = self._ping_delay
+            self._ping_task.wake()
 
     async def ping_registered_devices(self) -> None:
         """
@@ -264,57 +310,77 @@ class Lite(
         To permanently disconnect a device, an explicit device.disconnect(unregister=True [default value])
         will be needed. This way, the device won't be in the registered_devices list and
         BAC0 won't try to ping it.
+
+        When no device is registered, the delay between pings doubles each time
+        (up to PING_MAX_IDLE_DELAY, or the configured delay if longer) until a
+        device gets registered.
         """
-        for each in self.registered_devices:
-            if isinstance(each, RPDeviceConnected) or isinstance(
-                each, RPMDeviceConnected
+        if not self._registered_devices:
+            self._ping_task.delay = min(
+                self._ping_task.delay * 2, max(PING_MAX_IDLE_DELAY, self._ping_delay)
+            )
+            return
+        _devices = self.registered_devices
+        _semaphore = asyncio.Semaphore(16)
+        results = await asyncio.gather(
+            *[self._ping_device(each, _semaphore) for each in _devices],
+            return_exceptions=True,
+        )
+        for device, result in zip(_devices, results):
+            if isinstance(result, Exception):
+                self._log.error(f"Error while pinging {device} : {result}")
+
+    async def _ping_device(
+        self,
+        device: t.Union[RPDeviceConnected, RPMDeviceConnected],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        async with semaphore:
+            if isinstance(device, RPDeviceConnected) or isinstance(
+                device, RPMDeviceConnected
             ):
                 try:
                     self._log.debug(
-                        f"Ping {each.properties.name}|{each.properties.address}"
+                        "Ping %s|%s", device.properties.name, device.properties.address
                     )
-                    await each.ping()
-                    if each.properties.ping_failures > 3:
+                    await device.ping()
+                    if device.properties.ping_failures > 3:
                         raise NumerousPingFailures
 
                 except NumerousPingFailures:
                     self._log.warning(
                         "{}|{} is offline, disconnecting it.".format(
-                            each.properties.name, each.properties.address
+                            device.properties.name, device.properties.address
                         )
                     )
-                    await each._disconnect(unregister=False)
+                    await device._disconnect(unregister=False)
 
             else:
-                device_id = each.properties.device_id
-                addr = each.properties.address
+                device_id = device.properties.device_id
+                addr = device.properties.address
                 name = await self.read(f"{addr} device {device_id} objectName")
-                if name == each.properties.name:
-                    each.properties.ping_failures = 0
+                if name == device.properties.name:
+                    device.properties.ping_failures = 0
                     self._log.info(
                         "{}|{} is back online, reconnecting.".format(
-                            each.properties.name, each.properties.address
+                            device.properties.name, device.properties.address
                         )
                     )
-                    each.connect(network=self)
-                    each.poll(delay=each.properties.pollDelay)
+                    await device.connect(network=self)
+                    device.poll(delay=device.properties.pollDelay)
 
     @property
     def registered_devices(self):
         """
         Devices that have been created using BAC0.device(args)
         """
-        return list(self._registered_devices.values())
+        return list(self._registered_devices)
 
     def unregister_device(self, device):
         """
         Remove from the registered list
         """
-        oid = id(device)
-        try:
-            del self._registered_devices[oid]
-        except KeyError:
-            pass
+        self._registered_devices.discard(device)
 
     def add_trend(self, point_to_trend: t.Union[Point, TrendLog, VirtualPoint]) -> None:
         """
@@ -353,12 +419,52 @@ class Lite(
         if oid in self._points_to_trend.keys():
             del self._points_to_trend[oid]
 
+    def _load_device_cache(self) -> t.Dict[str, t.Tuple[str, str]]:
+        if self._device_cache_path is None or not os.path.exists(
+            self._device_cache_path
+        ):
+            return {}
+        try:
+            with open(self._device_cache_path, "r") as file:
+                return {k: tuple(v) for k, v in json.load(file).items()}
+        except (OSError, ValueError) as error:
+            self._log.warning(
+                f"Unable to load devices cache {self._device_cache_path} : {error}"
+            )
+            return {}
+
+    def _save_device_cache(self) -> None:
+        if self._device_cache_path is None:
+            return
+        _tmp = f"{self._device_cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._device_cache_path) or ".", exist_ok=True)
+            with open(_tmp, "w") as file:
+                json.dump(self._device_cache, file)
+            os.replace(_tmp, self._device_cache_path)
+        except OSError as error:
+            self._log.warning(
+                f"Unable to save devices cache {self._device_cache_path} : {error}"
+            )
+
+    @staticmethod
+    def _device_cache_key(discovered: t.Dict[str, t.Any]) -> str:
+        # The address already includes the network of routed devices
+        return f"{discovered['address']}|{discovered['object_instance'][1]}"
+
     @property
     async def devices(self):
         await self._devices(_return_list=False)
 
+    async def refresh_devices(self) -> t.List[t.Tuple[str, str, str, int]]:
+        """
+        Read again the name and vendor of every discovered device, ignoring
+        what is in the devices cache.
+        """
+        return await self._devices(_return_list=True, refresh=True)
+
     async def _devices(
-        self, _return_list: bool = False
+        self, _return_list: bool = False, refresh: bool = False
     ) -> t.List[t.Tuple[str, str, str, int]]:
         """
         This property will create a good looking table of all the discovered devices
@@ -366,43 +472,89 @@ class Lite(
 
         For that, some requests will be sent over the network to look for name,
         manufacturer, etc and in big network, this could be a long process.
+        Names and vendors are cached (on disk too if devices_cache was given) so
+        only devices missing from the cache are read. Use refresh=True (or
+        refresh_devices()) to read them all again.
         """
 
         lst = []
         if self.discoveredDevices is not None:
-            for k, v in self.discoveredDevices.items():
-                objid, device_address, network_number, vendor_id, vendor_name = (
-                    v["object_instance"],
-                    v["address"],
-                    v["network_number"],
-                    v["vendor_id"],
-                    v["vendor_name"],
+            _semaphore = asyncio.Semaphore(32)
+
+            async def _read_separately(device_address, devId):
+                return await asyncio.gather(
+                    self.read(f"{device_address} device {devId} objectName"),
+                    self.read(f"{device_address} device {devId} vendorName"),
                 )
-                devId = objid[1]
-                try:
-                    deviceName, vendorName = await self.readMultiple(
-                        f"{device_address} device {devId} objectName vendorName"
-                    )
-                except (UnrecognizedService, ValueError):
-                    self._log.warning(
-                        f"Unrecognized service for {devId} | {device_address}"
-                    )
+
+            async def _fetch(k, v):
+                device_address, network_number = v["address"], v["network_number"]
+                devId = v["object_instance"][1]
+                _key = self._device_cache_key(v)
+                async with _semaphore:
                     try:
-                        deviceName = await self.read(
-                            f"{device_address} device {devId} objectName"
-                        )
-                        vendorName = await self.read(
-                            f"{device_address} device {devId} vendorName"
-                        )
-                    except NoResponseFromController:
+                        if _key in self._no_rpm:
+                            deviceName, vendorName = await _read_separately(
+                                device_address, devId
+                            )
+                        else:
+                            try:
+                                deviceName, vendorName = await self.readMultiple(
+                                    f"{device_address} device {devId} objectName vendorName"
+                                )
+                            except UnrecognizedService:
+                                self._log.warning(
+                                    f"Unrecognized service for {devId} | {device_address}"
+                                )
+                                self._no_rpm.add(_key)
+                                deviceName, vendorName = await _read_separately(
+                                    device_address, devId
+                                )
+                            except ValueError:
+                                # Incomplete answer (ex. NAK), not a lack of support
+                                # for readMultiple, so only fall back this time
+                                self._log.warning(
+                                    f"Incomplete readMultiple answer for {devId} | {device_address}"
+                                )
+                                deviceName, vendorName = await _read_separately(
+                                    device_address, devId
+                                )
+                    except (NoResponseFromController, Timeout):
                         self.log(f"No response from {k}", level="warning")
-                        continue
-                except (NoResponseFromController, Timeout):
-                    self.log(f"No response from {k}", level="warning")
-                    continue
-                lst.append(
-                    (deviceName, vendorName, devId, device_address, network_number)
+                        return None
+                # Same str values whether the device comes from the cache or not
+                deviceName, vendorName = str(deviceName), str(vendorName)
+                self._device_cache[_key] = (deviceName, vendorName)
+                return (deviceName, vendorName, devId, device_address, network_number)
+
+            # Discovery may still be adding devices, work on a snapshot and only
+            # read the devices that are not already resolved.
+            snapshot = list(self.discoveredDevices.items())
+            _new = []
+            for k, v in snapshot:
+                devId = v["object_instance"][1]
+                _key = self._device_cache_key(v)
+                if not refresh and _key in self._device_cache:
+                    deviceName, vendorName = self._device_cache[_key]
+                    lst.append(
+                        (deviceName, vendorName, devId, v["address"], v["network_number"])
+                    )
+                else:
+                    _new.append((k, v))
+            if _new:
+                # One failing device must not discard what was read for the others
+                _answers = await asyncio.gather(
+                    *[_fetch(k, v) for k, v in _new], return_exceptions=True
                 )
+                results = []
+                for (k, _), answer in zip(_new, _answers):
+                    if isinstance(answer, BaseException):
+                        self._log.error(f"Error while reading {k} : {answer!r}")
+                    elif answer is not None:
+                        results.append(answer)
+                lst.extend(results)
+                if results:
+                    self._save_device_cache()
             if RICH:
                 console = Console()
                 table = Table(show_header=True, header_style="bold magenta")
@@ -436,7 +588,7 @@ class Lite(
         """
         This will present a list of all registered tasks
         """
-        return Task.tasks
+        return list(Task.tasks.values())
 
     def disconnect(self) -> None:
         asyncio.create_task(self._disconnect())
@@ -444,7 +596,12 @@ class Lite(
     async def _disconnect(self) -> None:
         self.log("Disconnecting", level="debug")
         for each in self.registered_devices:
-            await each._disconnect()
+            # Devices already disconnected (ex. after ping failures) have nothing
+            # to stop, they only need to leave the registered list
+            if isinstance(each, DeviceConnected):
+                await each._disconnect()
+            else:
+                self.unregister_device(each)
         await super()._disconnect()
         self._initialized = False
 
@@ -481,7 +638,7 @@ class Lite(
 
     async def __aenter__(self):
         while not self._initialized:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(self.spin)
         self._log.info(
             f"{self.localObjName}|{self.Boid} connected. Entering context manager."
         )
@@ -490,7 +647,7 @@ class Lite(
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._disconnect()
         while self._initialized:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(self.spin)
         self._log.info(
             f"{self.localObjName}|{self.Boid} disconnected. Exiting context manager."
         )
@@ -10,21 +10,38 @@ TaskManager.py - creation of threads used for repetitive tasks.
 A key building block for point simulation.
 """
 import asyncio
+import logging
 import time
+import typing as t
 from random import random
 
 
 # --- 3rd party modules ---
 # --- this application's modules ---
-from ..core.utils.notes import note_and_log
+from ..core.utils.notes import log_enabled_for, note_and_log
 
 # ------------------------------------------------------------------------------
 
 
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
 async def stopAllTasks():
     Task._log.info("Stopping all tasks")
-    for each in Task.tasks:
-        each.aio_task.cancel()
+    _current = asyncio.current_task()
+    _aio_tasks = [
+        each.aio_task
+        for each in list(Task.tasks.values())
+        if each.aio_task is not None
+        and not each.aio_task.done()
+        and each.aio_task is not _current
+    ]
+    for each in _aio_tasks:
+        each.cancel()
+    # Wait for cancellation to complete so cleanup code has run before we return
+    await asyncio.gather(*_aio_tasks, return_exceptions=True)
     Task._log.info("Ok all tasks stopped")
     Task.clean_tasklist()
     return True
@@ -32,13 +49,21 @@ async def stopAllTasks():
 
 @note_and_log
 class Task(object):
-    tasks = []
+    """
+    Base class of BAC0 asyncio tasks.
+
+    Started tasks are registered in Task.tasks. This is what keeps fire-and-forget
+    tasks alive while they run, as asyncio only holds weak references to its tasks.
+    A task removes itself from Task.tasks when its coroutine ends or is cancelled.
+    """
+
+    tasks: "t.Dict[int, Task]" = {}
     high_latency = 60
 
     @classmethod
     def clean_tasklist(cls):
         cls._log.debug("Cleaning tasks list")
-        cls.tasks = []
+        cls.tasks = {}
 
     @classmethod
     def number_of_tasks(cls):
@@ -58,17 +83,27 @@ class Task(object):
             self.delay = delay if delay >= 5 else 5
         else:
             self.delay = 0
+        # Scheduling uses the monotonic clock so NTP or DST changes of the
+        # wall clock don't affect delays and latency. Wall clock is only kept
+        # for display (previous_execution, next_execution).
         self.previous_execution = None
-        self.average_execution_delay = 0
-        self.average_latency = 0
-        self.next_execution = time.time() + delay + (random() * 10)
+        self._mono_previous = None
+        self._mono_next = time.monotonic() + delay + (random() * 10)
         self.execution_time = 0.0
-        self.count = 0
+        self.reset_stats()
 
         self._kwargs = None
         self._task = None
+        self._sleeper = None
         self.aio_task = None
 
+    def reset_stats(self):
+        self.count = 0
+        self.average_execution_delay = 0
+        self.average_latency = 0
+        self._latency_sum = 0.0
+        self._execution_delay_sum = 0.0
+
     async def task(self):
         raise NotImplementedError("Must be implemented")
 
@@ -77,23 +112,30 @@ class Task(object):
             self.log(
                 f"Installing recurring task {self.name} (id:{self.id})", level="info"
             )
+            # Executions are scheduled on absolute deadlines so the time spent
+            # running the task does not push every following execution.
+            self._mono_next = time.monotonic()
             while True:
                 self.count += 1
                 _start_time = time.time()
-                self.log(
-                    f"Executing : {self.name} | Count : {self.count}", level="debug"
-                )
-                self.log(f"Start Time : {_start_time}", level="debug")
-                if self.previous_execution:
+                _start_mono = time.monotonic()
+                # Checked each run as the log level can be changed at any time
+                _debug = log_enabled_for(self._log, logging.DEBUG)
+                if _debug:
                     self.log(
-                        f"Previous execution : {self.previous_execution}", level="debug"
+                        f"Executing : {self.name} | Count : {self.count}", level="debug"
                     )
-                else:
-                    self.log("First Run", level="debug")
+                    self.log(f"Start Time : {_start_time}", level="debug")
+                    if self.previous_execution:
+                        self.log(
+                            f"Previous execution : {self.previous_execution}",
+                            level="debug",
+                        )
+                    else:
+                        self.log("First Run", level="debug")
 
-                self.average_latency = (
-                    self.average_latency + (_start_time - self.next_execution)
-                ) / 2
+                self._latency_sum += _start_mono - self._mono_next
+                self.average_latency = self._latency_sum / self.count
                 try:
                     if self.fn and self.args is not None:
                         await self.fn(self.args)
@@ -109,11 +151,11 @@ class Task(object):
                         f"An exception occured while running the task {self.name} (id:{self.id}) : {error}",
                         level="error",
                     )
-                if self.previous_execution:
-                    _total = self.average_execution_delay + (
-                        _start_time - self.previous_execution
+                if self._mono_previous is not None:
+                    self._execution_delay_sum += _start_mono - self._mono_previous
+                    self.average_execution_delay = self._execution_delay_sum / max(
+                        self.count - 1, 1
                     )
-                    self.average_execution_delay = _total / 2
                 else:
                     self.average_execution_delay = self.delay
 
@@ -122,11 +164,24 @@ class Task(object):
                     self.log(f"High latency for {self.name}", level="warning")
                     self.log(f"Stats : {self}", level="warning")
 
-                self.execution_time = time.time() - _start_time
-                self.log(f"Execution Time : {self.execution_time}", level="debug")
+                self.execution_time = time.monotonic() - _start_mono
+                if _debug:
+                    self.log(f"Execution Time : {self.execution_time}", level="debug")
                 self.previous_execution = _start_time
-                self.next_execution = time.time() + self.delay
-                await asyncio.sleep(self.delay)
+                self._mono_previous = _start_mono
+                self._mono_next += self.delay
+                _sleep_for = self._mono_next - time.monotonic()
+                if _sleep_for < -self.delay:
+                    self.log(
+                        f"{self.name} fell behind schedule, rescheduling from now",
+                        level="warning",
+                    )
+                    self._mono_next = time.monotonic() + self.delay
+                    _sleep_for = self.delay
+                while await self._sleep(max(0, _sleep_for)):
+                    # Woken up by wake(), count the delay again from now
+                    self._mono_next = time.monotonic() + self.delay
+                    _sleep_for = self.delay
         else:  # one shot
             self.log(f"Running one shot task {self.name} (id:{self.id})", level="info")
             if self.fn and self.args is not None:
@@ -139,16 +194,45 @@ class Task(object):
                 else:
                     await self.task()
 
+    async def _sleep(self, delay):
+        """
+        Wait for the next execution. Returns True if woken up by wake().
+        """
+        loop = asyncio.get_running_loop()
+        self._sleeper = loop.create_future()
+        _handle = loop.call_later(delay, _set_result, self._sleeper, False)
+        try:
+            return await self._sleeper
+        finally:
+            _handle.cancel()
+            self._sleeper = None
+
+    def wake(self):
+        """
+        Restart the wait of a recurring task from now, using the current delay.
+        Useful when the delay was changed while the task was waiting.
+        """
+        if self._sleeper is not None:
+            _set_result(self._sleeper, True)
+
+    async def _run(self):
+        try:
+            await self.execute()
+        finally:
+            self.unregister()
+
     def start(self):
-        self.aio_task = asyncio.create_task(self.execute(), name=f"aio{self.name}")
-        Task.tasks.append(self)
+        self.aio_task = asyncio.create_task(self._run(), name=f"aio{self.name}")
+        Task.tasks[self.id] = self
+
+    def unregister(self):
+        Task.tasks.pop(self.id, None)
 
     def stop(self):
-        for each in Task.tasks:
-            if each.id == self.id:
-                each.aio_task.cancel()
-                Task.tasks.remove(each)
-                return True
+        if self.id in Task.tasks:
+            self.aio_task.cancel()
+            self.unregister()
+            return True
 
     @property
     def done(self):
@@ -157,6 +241,17 @@ class Task(object):
         else:
             return False
 
+    @property
+    def next_execution(self):
+        """
+        Wall clock time of the next execution
+        """
+        return time.time() + (self._mono_next - time.monotonic())
+
+    @next_execution.setter
+    def next_execution(self, value):
+        self._mono_next = time.monotonic() + (value - time.time())
+
     @property
     def last_time(self):
         return time.strftime(
@@ -185,7 +280,7 @@ class Task(object):
 
     def __lt__(self, other):
         # list sort use __lt__... little cheat to reverse list already
-        return self.next_execution > other.next_execution
+        return self._mono_next > other._mono_next
 
     def __eq__(self, other):
         # list remove use __eq__... so compare with id
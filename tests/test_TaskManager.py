@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import pytest
+
+from BAC0.tasks.RecurringTask import RecurringTask
+from BAC0.tasks.TaskManager import Task, stopAllTasks
+
+
+@pytest.fixture(autouse=True)
+def isolated_tasks(monkeypatch):
+    # Other tests leave their network tasks registered, keep ours separate
+    monkeypatch.setattr(Task, "tasks", {})
+
+
+def make_task(fn, delay):
+    # Task enforces a minimum delay of 5 seconds, shorten it for the tests
+    task = RecurringTask(fn, delay=delay, name="test")
+    task.delay = delay
+    return task
+
+
+def intervals(starts):
+    return [b - a for a, b in zip(starts, starts[1:])]
+
+
+@pytest.mark.asyncio
+async def test_cadence_does_not_drift_with_execution_time():
+    starts = []
+
+    async def work():
+        starts.append(time.monotonic())
+        await asyncio.sleep(0.1)
+
+    task = make_task(work, 0.3)
+    task.start()
+    await asyncio.sleep(1.35)
+    await stopAllTasks()
+
+    assert len(starts) == 5
+    for interval in intervals(starts):
+        assert interval == pytest.approx(0.3, abs=0.03)
+
+
+@pytest.mark.asyncio
+async def test_reschedule_from_now_when_far_behind():
+    starts, ends = [], []
+
+    async def work():
+        starts.append(time.monotonic())
+        if len(starts) == 1:
+            await asyncio.sleep(0.5)
+        ends.append(time.monotonic())
+
+    task = make_task(work, 0.2)
+    task.start()
+    await asyncio.sleep(0.8)
+    await stopAllTasks()
+
+    # No immediate catch-up run after the slow one, a full delay is waited
+    assert len(starts) >= 2
+    assert starts[1] - ends[0] == pytest.approx(0.2, abs=0.03)
+
+
+@pytest.mark.asyncio
+async def test_averages_are_arithmetic_means():
+    starts = []
+
+    async def work():
+        starts.append(time.monotonic())
+        # Uneven execution times, deadlines stay every 0.2 sec
+        await asyncio.sleep(0.05 * (len(starts) % 3))
+
+    task = make_task(work, 0.2)
+    task.start()
+    await asyncio.sleep(1.1)
+    await stopAllTasks()
+
+    assert task.count == len(starts)
+    _intervals = intervals(starts)
+    assert task.average_execution_delay == pytest.approx(
+        sum(_intervals) / len(_intervals), abs=0.005
+    )
+    assert task.average_latency == pytest.approx(0, abs=0.02)
+
+    task.reset_stats()
+    assert task.count == 0
+    assert task.average_execution_delay == 0
+    assert task.average_latency == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_all_tasks_waits_for_cancellation():
+    cleaned = []
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await asyncio.sleep(0.1)
+            cleaned.append(True)
+
+    task = make_task(work, 0.2)
+    task.start()
+    await asyncio.sleep(0.05)
+    assert Task.number_of_tasks() == 1
+
+    await stopAllTasks()
+
+    assert cleaned == [True]
+    assert task.done
+    assert Task.number_of_tasks() == 0
+
+
+@pytest.mark.asyncio
+async def test_wake_restarts_the_delay_from_now():
+    starts = []
+
+    async def work():
+        starts.append(time.monotonic())
+
+    task = make_task(work, 1)
+    task.start()
+    await asyncio.sleep(0.1)
+    task.delay = 0.2
+    _woken = time.monotonic()
+    task.wake()
+    await asyncio.sleep(0.3)
+    await stopAllTasks()
+
+    assert len(starts) == 2
+    assert starts[1] - _woken == pytest.approx(0.2, abs=0.03)
+
+
+@pytest.mark.asyncio
+async def test_wall_clock_step_does_not_affect_scheduling(monkeypatch):
+    starts = []
+
+    async def work():
+        starts.append(time.monotonic())
+
+    task = make_task(work, 0.2)
+    task.start()
+    await asyncio.sleep(0.1)
+    # Wall clock jumps one hour ahead (NTP step, DST...)
+    _real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: _real_time() + 3600)
+    await asyncio.sleep(0.55)
+    await stopAllTasks()
+
+    assert len(starts) == 4
+    for interval in intervals(starts):
+        assert interval == pytest.approx(0.2, abs=0.03)
+    assert task.average_latency == pytest.approx(0, abs=0.02)
+    # Wall clock is still used for display
+    assert task.previous_execution > _real_time() + 3000
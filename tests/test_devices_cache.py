@@ -0,0 +1,182 @@
+import pytest
+
+from BAC0.core.io.IOExceptions import UnknownPropertyError, UnrecognizedService
+from BAC0.scripts.Lite import Lite
+
+
+class FakeNetwork:
+    """
+    Lite built without a BACnet stack, answering readMultiple and read
+    from a dict of devices {instance: (name, vendor)}.
+    """
+
+    def __init__(self, tmp_path, devices, cache_file=True):
+        self.devices = devices
+        self.rpm_requests = []
+        self.rp_requests = []
+        self.lite = Lite.__new__(Lite)
+        self.lite._device_cache_path = (
+            str(tmp_path / "devices.json") if cache_file else None
+        )
+        self.lite._device_cache = self.lite._load_device_cache()
+        self.lite._no_rpm = set()
+        self.lite.discoveredDevices = {
+            f"device,{instance}": {
+                "object_instance": ("device", instance),
+                "address": f"2:{instance}",
+                "network_number": {2},
+                "vendor_id": 842,
+                "vendor_name": "unknown",
+            }
+            for instance in devices
+        }
+        self.lite.readMultiple = self.readMultiple
+        self.lite.read = self.read
+
+    async def readMultiple(self, request):
+        self.rpm_requests.append(request)
+        instance = int(request.split()[2])
+        return list(self.devices[instance])
+
+    async def read(self, request):
+        self.rp_requests.append(request)
+        _, _, instance, prop = request.split()
+        name, vendor = self.devices[int(instance)]
+        return name if prop == "objectName" else vendor
+
+
+@pytest.mark.asyncio
+async def test_only_unresolved_devices_are_read(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+
+    first = await network.lite._devices(_return_list=True)
+    assert first == [("AHU-1", "Servisys", 5, "2:5", {2})]
+    assert len(network.rpm_requests) == 1
+
+    # A device found later is the only one read
+    network.devices[6] = ("AHU-2", "Servisys")
+    network.lite.discoveredDevices["device,6"] = {
+        "object_instance": ("device", 6),
+        "address": "2:6",
+        "network_number": {2},
+        "vendor_id": 842,
+        "vendor_name": "unknown",
+    }
+    second = await network.lite._devices(_return_list=True)
+    assert sorted(second) == sorted(first + [("AHU-2", "Servisys", 6, "2:6", {2})])
+    assert network.rpm_requests[1:] == ["2:6 device 6 objectName vendorName"]
+    assert network.rp_requests == []
+
+
+@pytest.mark.asyncio
+async def test_cache_is_saved_and_loaded(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+    await network.lite._devices(_return_list=True)
+
+    assert (tmp_path / "devices.json").exists()
+    assert not (tmp_path / "devices.json.tmp").exists()
+
+    # A new session loads the names from the file, nothing is read
+    new_session = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+    assert await new_session.lite._devices(_return_list=True) == [
+        ("AHU-1", "Servisys", 5, "2:5", {2})
+    ]
+    assert new_session.rpm_requests == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_reads_again(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+    await network.lite._devices(_return_list=True)
+
+    network.devices[5] = ("AHU-1-renamed", "Servisys")
+    assert await network.lite._devices(_return_list=True) == [
+        ("AHU-1", "Servisys", 5, "2:5", {2})
+    ]
+    assert await network.lite.refresh_devices() == [
+        ("AHU-1-renamed", "Servisys", 5, "2:5", {2})
+    ]
+    assert len(network.rpm_requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_no_file_without_devices_cache(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")}, cache_file=False)
+    await network.lite._devices(_return_list=True)
+    await network.lite._devices(_return_list=True)
+
+    assert list(tmp_path.iterdir()) == []
+    # Still kept in memory for the session
+    assert len(network.rpm_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_same_types_from_network_and_cache(tmp_path):
+    class Name:
+        def __str__(self):
+            return "AHU-1"
+
+    network = FakeNetwork(tmp_path, {5: (Name(), "Servisys")})
+    fresh = await network.lite._devices(_return_list=True)
+    cached = await network.lite._devices(_return_list=True)
+
+    assert fresh == cached == [("AHU-1", "Servisys", 5, "2:5", {2})]
+
+
+def fail_readMultiple(network, exception):
+    async def readMultiple(request):
+        network.rpm_requests.append(request)
+        raise exception
+
+    network.lite.readMultiple = readMultiple
+
+
+@pytest.mark.asyncio
+async def test_no_readMultiple_for_devices_not_supporting_it(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+    fail_readMultiple(network, UnrecognizedService())
+
+    assert await network.lite._devices(_return_list=True) == [
+        ("AHU-1", "Servisys", 5, "2:5", {2})
+    ]
+    assert network.lite._no_rpm == {"2:5|5"}
+    assert len(network.rpm_requests) == 1
+
+    # Next reads go straight to read
+    await network.lite.refresh_devices()
+    assert len(network.rpm_requests) == 1
+    assert len(network.rp_requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_incomplete_readMultiple_only_falls_back_once(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys")})
+    fail_readMultiple(network, ValueError())
+
+    assert await network.lite._devices(_return_list=True) == [
+        ("AHU-1", "Servisys", 5, "2:5", {2})
+    ]
+    assert network.lite._no_rpm == set()
+    assert len(network.rp_requests) == 2
+
+    # readMultiple is tried again on the next read
+    await network.lite.refresh_devices()
+    assert len(network.rpm_requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_one_failing_device_does_not_abort_the_others(tmp_path):
+    network = FakeNetwork(tmp_path, {5: ("AHU-1", "Servisys"), 6: ("AHU-2", "")})
+    _readMultiple = network.readMultiple
+
+    async def readMultiple(request):
+        if request.startswith("2:6 "):
+            raise UnknownPropertyError("vendorName")
+        return await _readMultiple(request)
+
+    network.lite.readMultiple = readMultiple
+
+    assert await network.lite._devices(_return_list=True) == [
+        ("AHU-1", "Servisys", 5, "2:5", {2})
+    ]
+    assert network.lite._device_cache == {"2:5|5": ("AHU-1", "Servisys")}
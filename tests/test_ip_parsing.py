@@ -0,0 +1,42 @@
+import pytest
+
+from BAC0.core.io.IOExceptions import InitializationError
+from BAC0.scripts.Lite import parse_ip
+
+
+@pytest.mark.parametrize(
+    "ip, mask, port, expected",
+    [
+        ("192.168.1.10", None, None, ("192.168.1.10", 24, 47808)),
+        ("192.168.1.10/16", None, None, ("192.168.1.10", 16, 47808)),
+        ("192.168.1.10:47809", None, None, ("192.168.1.10", 24, 47809)),
+        ("192.168.1.10/16:47809", None, None, ("192.168.1.10", 16, 47809)),
+        (" 192.168.1.10/16 ", None, None, ("192.168.1.10", 16, 47808)),
+        # mask and port arguments are used when not in the string
+        ("192.168.1.10", 20, 47810, ("192.168.1.10", 20, 47810)),
+        ("192.168.1.10/16", 20, 47810, ("192.168.1.10", 16, 47810)),
+        ("192.168.1.10:47809", 20, 47810, ("192.168.1.10", 20, 47809)),
+        # ...but the string wins when both are given
+        ("192.168.1.10/16:47809", 20, 47810, ("192.168.1.10", 16, 47809)),
+    ],
+)
+def test_parse_ip(ip, mask, port, expected):
+    assert parse_ip(ip, mask, port) == expected
+
+
+@pytest.mark.parametrize(
+    "ip",
+    [
+        "",
+        "192.168.1.10/",
+        "192.168.1.10/mask",
+        "192.168.1.10/24:port",
+        "192.168.1.10/24/24",
+        "192.168.1.10:47808/24",
+        "192.168.1.10\n/24",
+        "192.168.1.10 /24",
+    ],
+)
+def test_parse_ip_invalid(ip):
+    with pytest.raises(InitializationError):
+        parse_ip(ip)
@@ -0,0 +1,102 @@
+import asyncio
+import time
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from BAC0.core.devices.Device import RPMDeviceConnected
+from BAC0.scripts.Lite import PING_MAX_IDLE_DELAY, Lite
+from BAC0.tasks.RecurringTask import RecurringTask
+
+
+def make_lite(ping_delay=300):
+    # Lite built without a BACnet stack, the ping task is never started
+    lite = Lite.__new__(Lite)
+    lite._registered_devices = weakref.WeakSet()
+    lite._ping_task = RecurringTask(
+        lite.ping_registered_devices, delay=ping_delay, name="Ping Task"
+    )
+    lite._ping_delay = lite._ping_task.delay
+    return lite
+
+
+def make_device(name, ping_time=0.2, ping_failures=0):
+    device = RPMDeviceConnected.__new__(RPMDeviceConnected)
+    device.properties = SimpleNamespace(
+        name=name, address=f"2:{name}", ping_failures=ping_failures
+    )
+    device.disconnected = []
+
+    async def ping():
+        await asyncio.sleep(ping_time)
+
+    async def _disconnect(unregister=True):
+        device.disconnected.append(unregister)
+
+    device.ping = ping
+    device._disconnect = _disconnect
+    return device
+
+
+@pytest.mark.asyncio
+async def test_idle_ping_delay_doubles_up_to_max():
+    lite = make_lite()
+
+    delays = []
+    for _ in range(6):
+        await lite.ping_registered_devices()
+        delays.append(lite._ping_task.delay)
+    assert delays == [600, 1200, 2400, 3600, 3600, 3600]
+    assert PING_MAX_IDLE_DELAY == 3600
+
+
+@pytest.mark.asyncio
+async def test_idle_ping_delay_never_below_ping_delay():
+    lite = make_lite(ping_delay=7200)
+
+    await lite.ping_registered_devices()
+    assert lite._ping_task.delay == 7200
+
+
+@pytest.mark.asyncio
+async def test_register_device_resets_ping_delay():
+    lite = make_lite()
+    await lite.ping_registered_devices()
+    await lite.ping_registered_devices()
+    # Ping task waiting for its next execution
+    lite._ping_task._sleeper = asyncio.get_running_loop().create_future()
+
+    device = make_device("AHU-1")
+    lite.register_device(device)
+
+    assert lite._ping_task.delay == 300
+    assert lite._ping_task._sleeper.done()
+    assert lite.registered_devices == [device]
+
+
+@pytest.mark.asyncio
+async def test_devices_are_pinged_concurrently():
+    lite = make_lite()
+    devices = [make_device("AHU-1"), make_device("AHU-2")]
+    for device in devices:
+        lite.register_device(device)
+
+    start = time.monotonic()
+    await lite.ping_registered_devices()
+    assert time.monotonic() - start < 0.35
+    assert lite._ping_task.delay == 300
+
+
+@pytest.mark.asyncio
+async def test_numerous_ping_failures_disconnect_without_unregistering():
+    lite = make_lite()
+    offline = make_device("AHU-1", ping_time=0, ping_failures=4)
+    online = make_device("AHU-2", ping_time=0)
+    for device in (offline, online):
+        lite.register_device(device)
+
+    await lite.ping_registered_devices()
+
+    assert offline.disconnected == [False]
+    assert online.disconnected == []